@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-1 hex digest of a file's contents"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class AssetCache:
+    """
+    Persistent per-file result cache keyed by absolute path.
+
+    A file is considered unchanged when its size and mtime match the cached
+    entry. When they don't, callers can still reuse the previous result if
+    the content hash matches (e.g. after a touch or a re-copy of the same
+    bytes), which saves the expensive part of the work.
+    Entries are tagged with a version so a stage can invalidate its cache
+    when the shape of its results changes.
+    """
+
+    def __init__(self, cache_path, version=1):
+        self.cache_path = Path(cache_path)
+        self.version = version
+        self.entries = {}
+        self.dirty = False
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("version") == version:
+                self.entries = cached.get("entries", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    @staticmethod
+    def key(path):
+        return str(Path(path).resolve())
+
+    def lookup(self, path, stat=None):
+        """Cached result if size and mtime are unchanged, else None"""
+        entry = self.entries.get(self.key(path))
+        if entry is None:
+            return None
+        stat = stat or os.stat(path)
+        if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["result"]
+        return None
+
+    def previous(self, path):
+        """(sha1, result) last stored for a path, or (None, None)"""
+        entry = self.entries.get(self.key(path))
+        if entry is None:
+            return None, None
+        return entry["sha1"], entry["result"]
+
+    def store(self, path, digest, result, stat=None):
+        stat = stat or os.stat(path)
+        self.entries[self.key(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": digest,
+            "result": result,
+        }
+        self.dirty = True
+
+    def prune(self, keep_paths, root):
+        """
+        Drop entries under root for files that are no longer part of the run.
+        Entries for other directories sharing this cache file are kept.
+        """
+        keep = {self.key(path) for path in keep_paths}
+        prefix = os.path.join(self.key(root), '')
+        for key in list(self.entries):
+            if key.startswith(prefix) and key not in keep:
+                del self.entries[key]
+                self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.version, "entries": self.entries}, f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+def map_with_cache(worker, paths, cache=None, jobs=None, root=None):
+    """
+    Run worker over every path not already answered by the cache.
+
+    worker receives (path, previous_sha1, previous_result) and must return
+    (path, sha1, result); it should skip its expensive work when the sha1 it
+    computes equals previous_sha1. Runs on a process pool unless jobs == 1.
+    root is the directory the paths were collected from; stale cache entries
+    are only pruned under it (default: the paths' common directory).
+    Returns ({path: result}, number_of_files_processed).
+    """
+    results = {}
+    pending = []
+
+    for path in paths:
+        cached = cache.lookup(path) if cache else None
+        if cached is not None:
+            results[str(path)] = cached
+        else:
+            previous_digest, previous_result = cache.previous(path) if cache else (None, None)
+            pending.append((str(path), previous_digest, previous_result))
+
+    if len(pending) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            processed = list(pool.map(worker, pending, chunksize=16))
+    else:
+        processed = [worker(job) for job in pending]
+
+    for path, digest, result in processed:
+        results[path] = result
+        if cache and result is not None:
+            cache.store(path, digest, result)
+
+    if cache:
+        if root is None and paths:
+            root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+        if root is not None:
+            cache.prune(paths, root)
+        cache.save()
+
+    return results, len(pending)
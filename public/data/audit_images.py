@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+from asset_cache import AssetCache, map_with_cache
+from catalog import IMAGE_EXTS, image_stem, iter_catalog_entries
+
+# Bump when the shape of inspect_image results changes
+AUDIT_CACHE_VERSION = 1
+
+EXTENSION_FORMATS = {
+    '.png': 'png',
+    '.jpg': 'jpeg',
+    '.jpeg': 'jpeg',
+    '.webp': 'webp',
+    '.gif': 'gif',
+}
+
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+def sniff_format(data):
+    """Detect the real image format from the magic bytes"""
+    if data.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if data.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    return None
+
+def _jpeg_dimensions(data):
+    i = 2
+    while i + 9 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker in (0x01, *range(0xD0, 0xD8)):  # markers without a length
+            i += 2
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[i + 5:i + 9])
+            return width, height
+        segment_length = struct.unpack('>H', data[i + 2:i + 4])[0]
+        i += 2 + segment_length
+    return None
+
+def _webp_dimensions(data):
+    chunk = data[12:16]
+    if chunk == b'VP8 ' and len(data) >= 30:
+        width = struct.unpack('<H', data[26:28])[0] & 0x3FFF
+        height = struct.unpack('<H', data[28:30])[0] & 0x3FFF
+        return width, height
+    if chunk == b'VP8L' and len(data) >= 25:
+        bits = int.from_bytes(data[21:25], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X' and len(data) >= 30:
+        return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+    return None
+
+def read_dimensions(image_format, data):
+    """(width, height) decoded from the image header, or None"""
+    try:
+        if image_format == 'png' and data[12:16] == b'IHDR':
+            return struct.unpack('>II', data[16:24])
+        if image_format == 'jpeg':
+            return _jpeg_dimensions(data)
+        if image_format == 'webp':
+            return _webp_dimensions(data)
+        if image_format == 'gif':
+            return struct.unpack('<HH', data[6:10])
+    except struct.error:
+        pass
+    return None
+
+def is_truncated(image_format, data):
+    """True if the file is cut off before the format's end marker"""
+    tail = data[-64:]
+    if image_format == 'png':
+        return b'IEND\xaeB`\x82' not in tail
+    if image_format == 'jpeg':
+        return b'\xff\xd9' not in tail
+    if image_format == 'webp':
+        return len(data) < 8 or struct.unpack('<I', data[4:8])[0] + 8 > len(data)
+    if image_format == 'gif':
+        return not data.rstrip(b'\x00').endswith(b';')
+    return False
+
+def inspect_image(job):
+    """
+    Worker: hash a file and, unless the hash matches the previous run,
+    decode its format, dimensions and truncation state.
+    """
+    path, previous_digest, previous_result = job
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == previous_digest:
+        return path, digest, previous_result
+
+    image_format = sniff_format(data)
+    dimensions = read_dimensions(image_format, data) if image_format else None
+    return path, digest, {
+        "format": image_format,
+        "width": dimensions[0] if dimensions else None,
+        "height": dimensions[1] if dimensions else None,
+        "truncated": is_truncated(image_format, data) if image_format else False,
+    }
+
+def find_file_problems(path, facts, min_size):
+    """Human-readable problems for one image, based on its inspected facts"""
+    problems = []
+    claimed_format = EXTENSION_FORMATS.get(path.suffix.lower())
+
+    if facts["format"] is None:
+        problems.append("not a recognised image (bad magic bytes)")
+        return problems
+    if claimed_format != facts["format"]:
+        problems.append(f"named {path.suffix} but is actually {facts['format']}")
+    if facts["truncated"]:
+        problems.append("truncated (missing end marker)")
+    if facts["width"] is None:
+        problems.append("could not decode dimensions")
+    elif min(facts["width"], facts["height"]) < min_size:
+        problems.append(f"undersized ({facts['width']}x{facts['height']}, minimum {min_size}px)")
+    if path.suffix not in IMAGE_EXTS:
+        problems.append(f"extension {path.suffix} is never requested by the frontend")
+    return problems
+
+def audit_images(images_dir, data_dir=".", cache_path=None, min_size=200, jobs=None):
+    """
+    Audit every file in images_dir against its name and the catalog.
+    Returns a report dict with per-file problems, missing and orphan images.
+    """
+    images_path = Path(images_dir)
+    if not images_path.exists():
+        print(f"Directory {images_dir} does not exist")
+        return None
+
+    files = sorted(Path(entry.path) for entry in os.scandir(images_path)
+                   if entry.is_file() and not entry.name.startswith('.'))
+
+    cache = AssetCache(cache_path, version=AUDIT_CACHE_VERSION) if cache_path else None
+    facts_by_path, inspected = map_with_cache(inspect_image, files, cache, jobs, root=images_path)
+    print(f"Audited {len(files)} files in {images_dir} ({len(files) - inspected} cached, {inspected} inspected)")
+
+    file_problems = {}
+    for path in files:
+        problems = find_file_problems(path, facts_by_path[str(path)], min_size)
+        if problems:
+            file_problems[path.name] = problems
+
+    expected = {}
+    for catalog_file, language, dialect, entry in iter_catalog_entries(data_dir):
+        expected.setdefault(image_stem(language, dialect), catalog_file)
+
+    present_stems = {path.stem for path in files if path.suffix in IMAGE_EXTS}
+    missing = sorted(f"{stem} ({catalog_file})" for stem, catalog_file in expected.items()
+                     if stem not in present_stems)
+    orphans = sorted(path.name for path in files if path.stem not in expected)
+
+    return {
+        "files": len(files),
+        "inspected": inspected,
+        "problems": file_problems,
+        "missing": missing,
+        "orphans": orphans,
+    }
+
+def print_report(report):
+    print(f"\nFiles with problems: {len(report['problems'])}")
+    for name, problems in report["problems"].items():
+        print(f"  ✗ {name}: {'; '.join(problems)}")
+
+    print(f"\nCatalog entries without an image: {len(report['missing'])}")
+    for name in report["missing"]:
+        print(f"  ⚠️  {name}")
+
+    print(f"\nOrphan images without a catalog entry: {len(report['orphans'])}")
+    for name in report["orphans"]:
+        print(f"  ⚠️  {name}")
+
+def main():
+    report = audit_images("images_data", cache_path="../../.cache/image_audit.json")
+    if report:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
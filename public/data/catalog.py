@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+import json
+import re
+from pathlib import Path
+
+# The three catalog files the globe loads, all keyed language -> dialect -> entry
+CATALOG_FILES = ["data.json", "definitely_endangered.json", "severely_endangered.json"]
+
+# Extensions ExtendedLanguageModal.jsx tries, in order
+IMAGE_EXTS = ['.jpg', '.JPG', '.jpeg', '.png', '.webp']
+
+def image_stem(language, dialect):
+    """
+    File name (without extension) the frontend looks up for a dialect,
+    e.g. ('en', 'new york') -> 'en_new_york'.
+    """
+    dialect_key_file = re.sub(r'\s+', '_', dialect.lower())
+    return f"{language.lower()}_{dialect_key_file}"
+
+def load_catalog(json_file_path):
+    """Load one catalog file, returning {} if it is missing"""
+    try:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"⚠️  Catalog file {json_file_path} not found")
+        return {}
+
+def iter_catalog_entries(data_dir=".", catalog_files=CATALOG_FILES):
+    """
+    Yield (catalog_file, language, dialect, entry) for every dialect
+    across the catalog files in data_dir.
+    """
+    for catalog_file in catalog_files:
+        catalog = load_catalog(Path(data_dir) / catalog_file)
+        for language, dialects in catalog.items():
+            for dialect, entry in dialects.items():
+                yield catalog_file, language, dialect, entry
+
+def find_catalog_image(images_dir, stem):
+    """Return the image the frontend would pick for a stem, or None"""
+    for ext in IMAGE_EXTS:
+        candidate = Path(images_dir) / f"{stem}{ext}"
+        if candidate.is_file():
+            return candidate
+    return None
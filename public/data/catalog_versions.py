@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from catalog import CATALOG_FILES, load_catalog
+
+MANIFEST_FORMAT = 1
+
+def load_joined_catalog(data_dir="."):
+    """The catalog the globe loads: {catalog_file: contents}"""
+    return {catalog_file: load_catalog(Path(data_dir) / catalog_file) for catalog_file in CATALOG_FILES}
+
+def catalog_version(catalog):
+    """Content-addressed version id, independent of key order"""
+    canonical = json.dumps(catalog, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def diff_values(old, new):
+    """
+    Keyed diff between two JSON values, or None when they are equal.
+
+    Dicts are diffed per key: a removed key maps to null, a changed key
+    maps to its nested diff. Lists of strings (voice_ids) become
+    {"$add": [...], "$remove": [...]} when that reproduces the new list
+    exactly; anything else is replaced wholesale with {"$set": value}.
+    """
+    if old == new:
+        return None
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, old_value in old.items():
+            if key not in new:
+                changes[key] = None
+            else:
+                change = diff_values(old_value, new[key])
+                if change is not None:
+                    changes[key] = change
+        for key, new_value in new.items():
+            if key not in old:
+                changes[key] = {"$set": new_value}
+        return changes
+
+    if _is_string_list(old) and _is_string_list(new):
+        new_items = set(new)
+        old_items = set(old)
+        change = {}
+        removed = [item for item in old if item not in new_items]
+        added = [item for item in new if item not in old_items]
+        if removed:
+            change["$remove"] = removed
+        if added:
+            change["$add"] = added
+        if change and apply_change(old, change) == new:
+            return change
+
+    return {"$set": new}
+
+def apply_change(old, change):
+    """Apply one diff_values result to a value, returning the new value"""
+    if "$set" in change:
+        return change["$set"]
+
+    if "$add" in change or "$remove" in change:
+        removed = set(change.get("$remove", []))
+        return [item for item in old if item not in removed] + change.get("$add", [])
+
+    updated = dict(old)
+    for key, nested_change in change.items():
+        if nested_change is None:
+            updated.pop(key, None)
+        else:
+            updated[key] = apply_change(updated.get(key), nested_change)
+    return updated
+
+def _write_json(path, data):
+    """Write compact JSON atomically, returning its size in bytes"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+def publish_catalog_version(data_dir=".", versions_dir="catalog_versions", keep=5):
+    """
+    Snapshot the current catalog and emit deltas from the previous `keep`
+    versions straight to it, then update manifest.json. Clients holding
+    one of those versions fetch a single delta, anyone else the snapshot.
+    """
+    versions_path = Path(data_dir) / versions_dir
+    manifest_path = versions_path / "manifest.json"
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        manifest = {"format": MANIFEST_FORMAT, "latest": None, "versions": [], "deltas": {}}
+
+    catalog = load_joined_catalog(data_dir)
+    version = catalog_version(catalog)
+    if version == manifest["latest"]:
+        print(f"Catalog version {version} is already published")
+        return manifest
+
+    snapshot_file = f"snapshots/{version}.json"
+    snapshot_bytes = _write_json(versions_path / snapshot_file, catalog)
+    print(f"✓ Snapshot {version} ({snapshot_bytes:,} bytes)")
+
+    previous_versions = [entry for entry in manifest["versions"] if entry["version"] != version][-keep:]
+    deltas = {}
+    for entry in previous_versions:
+        old_version = entry["version"]
+        try:
+            with open(versions_path / entry["snapshot"], 'r', encoding='utf-8') as f:
+                old_catalog = json.load(f)
+        except FileNotFoundError:
+            print(f"  ⚠️  Snapshot for {old_version} is missing, no delta emitted")
+            continue
+
+        changes = diff_values(old_catalog, catalog) or {}
+        if apply_change(old_catalog, changes) != catalog:
+            print(f"  ✗ Delta {old_version} -> {version} does not reproduce the snapshot, skipping")
+            continue
+
+        delta_file = f"deltas/{old_version}-{version}.json"
+        delta = {"format": MANIFEST_FORMAT, "from": old_version, "to": version, "changes": changes}
+        delta_bytes = _write_json(versions_path / delta_file, delta)
+        if delta_bytes >= snapshot_bytes:
+            # Not worth it: clients are better off downloading the snapshot
+            (versions_path / delta_file).unlink()
+            continue
+
+        deltas[old_version] = {"path": delta_file, "bytes": delta_bytes}
+        print(f"  ✓ Delta {old_version} -> {version} ({delta_bytes:,} bytes)")
+
+    kept_versions = previous_versions + [{
+        "version": version,
+        "snapshot": snapshot_file,
+        "bytes": snapshot_bytes,
+        "created": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }]
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "latest": version,
+        "snapshot": snapshot_file,
+        "versions": kept_versions,
+        "deltas": deltas,
+    }
+    # The manifest goes last so it never points at files that don't exist yet
+    _write_json(manifest_path, manifest)
+
+    referenced = {versions_path / entry["snapshot"] for entry in kept_versions}
+    referenced |= {versions_path / delta["path"] for delta in deltas.values()}
+    for folder in ("snapshots", "deltas"):
+        for old_file in (versions_path / folder).glob("*.json"):
+            if old_file not in referenced:
+                old_file.unlink()
+
+    print(f"Published catalog version {version} with {len(deltas)} deltas")
+    return manifest
+
+def published_version(data_dir=".", versions_dir="catalog_versions"):
+    """Latest version in manifest.json, or None when nothing was published"""
+    try:
+        with open(Path(data_dir) / versions_dir / "manifest.json", 'r', encoding='utf-8') as f:
+            return json.load(f).get("latest")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def check_published(data_dir=".", versions_dir="catalog_versions"):
+    """
+    Warn when the catalog files changed since the last publish: once a manifest
+    exists the globe only loads published snapshots, so edits stay invisible.
+    Returns True if clients see the current catalog.
+    """
+    latest = published_version(data_dir, versions_dir)
+    if latest is None:
+        return True
+    live = catalog_version(load_joined_catalog(data_dir))
+    if live != latest:
+        print(f"⚠️  Catalog files are at version {live} but {versions_dir} publishes {latest}. "
+              f"Run `languagegarden.py publish` or the globe keeps showing the old catalog.")
+        return False
+    return True
+
+def republish_if_versioned(data_dir=".", versions_dir="catalog_versions", keep=5):
+    """Publish after a catalog rewrite, unless this deployment doesn't use versions"""
+    if published_version(data_dir, versions_dir) is None:
+        return None
+    return publish_catalog_version(data_dir, versions_dir, keep)
+
+def main():
+    publish_catalog_version()
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
 import os
-from elevenlabs import ElevenLabs
-from dotenv import load_dotenv
 from collections import defaultdict
 import json
 
-load_dotenv()
-API_KEY = os.getenv("ELEVEN_API_KEY")  # or set directly
-
 def build_voice_dict():
     """Build dictionary: language -> accent -> [voice_ids]"""
+    # The SDK and .env are only needed when we actually talk to ElevenLabs
+    from elevenlabs import ElevenLabs
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    # Point ELEVENLABS_BASE_URL at mock_services.py to run offline; it needs no real key
+    base_url = os.getenv("ELEVENLABS_BASE_URL")
     client = ElevenLabs(
-        base_url="https://api.elevenlabs.io",
-        api_key=API_KEY,
+        base_url=base_url or "https://api.elevenlabs.io",
+        api_key=os.getenv("ELEVEN_API_KEY") or ("offline" if base_url else None),
     )
     
     voice_dict = defaultdict(lambda: defaultdict(list))
@@ -3,23 +3,43 @@ import os
 import re
 import time
 import json
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+from audit_images import sniff_format
+from catalog import IMAGE_EXTS
+
+# Extension saved for each sniffed format; other formats are never looked up by the frontend
+FORMAT_EXTENSIONS = {
+    'jpeg': '.jpg',
+    'png': '.png',
+    'webp': '.webp',
+}
 
 # --- CONFIGURATION ---
-# Get API keys from environment variables
-API_KEY = os.getenv("GUSTAVO_API_KEY")
-CSE_ID = os.getenv("CSE_ID")
-print("API_KEY:", API_KEY)
-print("CSE_ID:", CSE_ID)
-
-# Check if the required environment variables are set
-if not API_KEY:
-    raise ValueError("❌ ERROR: GUSTAVO_API_KEY not found in your .env file")
-if not CSE_ID:
-    raise ValueError("❌ ERROR: CSE_ID not found in your .env file")
+
+def load_credentials():
+    """
+    Loads the Custom Search credentials from the environment (.env file).
+    Called lazily so that importing this module never requires API keys.
+    When CSE_BASE_URL points at mock_services.py, missing keys are replaced by placeholders.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    api_key = os.getenv("GUSTAVO_API_KEY")
+    cse_id = os.getenv("CSE_ID")
+
+    # mock_services.py ignores credentials, so offline runs need no .env
+    if os.getenv("CSE_BASE_URL") and not (api_key and cse_id):
+        print(f"Using placeholder credentials for {os.getenv('CSE_BASE_URL')}")
+        return api_key or "offline", cse_id or "offline"
+
+    # Check if the required environment variables are set
+    if not api_key:
+        raise ValueError("❌ ERROR: GUSTAVO_API_KEY not found in your .env file")
+    if not cse_id:
+        raise ValueError("❌ ERROR: CSE_ID not found in your .env file")
+
+    return api_key, cse_id
 
 # --- SCRIPT ---
 
@@ -34,11 +54,75 @@ def build_search_query(language_data):
     
     return f'"{name}" people'
 
+def search_image_url(query, api_key, cse_id):
+    """
+    Runs one Custom Search image query (one unit of the daily quota) and
+    returns the link of the top result, or None if there is none.
+    Raises requests.exceptions.HTTPError on API errors, including quota errors.
+    """
+    # Point CSE_BASE_URL at mock_services.py to run offline
+    search_url = os.getenv("CSE_BASE_URL", "https://www.googleapis.com") + "/customsearch/v1"
+    params = {
+        'q': query,
+        'cx': cse_id,
+        'key': api_key,
+        'searchType': 'image',
+        'num': 1, # We only want the top result
+        'imgSize': 'medium'
+    }
+
+    response = requests.get(search_url, params=params)
+    response.raise_for_status()
+    search_results = response.json()
+
+    image_items = search_results.get('items')
+    if not image_items:
+        return None
+    return image_items[0].get('link')
+
+def download_image(image_url, output_folder, file_stem):
+    """
+    Downloads an image with a browser User-Agent and saves it as
+    output_folder/file_stem + the extension of its real format.
+    Other extension variants of file_stem are removed so the new file is the one picked.
+    Raises ValueError if the response is not a JPEG, PNG or WebP image.
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    image_response = requests.get(image_url, headers=headers, timeout=10)
+    image_response.raise_for_status()
+
+    # The URL often lies (.php, .gif thumbnails, no extension), so trust the magic bytes
+    image_format = sniff_format(image_response.content)
+    file_extension = FORMAT_EXTENSIONS.get(image_format)
+    if file_extension is None:
+        raise ValueError(f"unsupported image format {image_format or 'unknown'} from {image_url}")
+
+    file_path = os.path.join(output_folder, f"{file_stem}{file_extension}")
+
+    # Write beside the target and swap it in, so an image that organize_pinterest_images
+    # hardlinked into place is replaced rather than overwritten through the link
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(image_response.content)
+    os.replace(tmp_path, file_path)
+
+    for ext in IMAGE_EXTS:
+        variant = os.path.join(output_folder, f"{file_stem}{ext}")
+        # samefile guards case-insensitive filesystems, where .JPG is the new .jpg
+        if os.path.isfile(variant) and not os.path.samefile(variant, file_path):
+            os.remove(variant)
+
+    return file_path
+
 def download_images_for_json(json_file_path, output_folder):
     """
     Processes a JSON file, searches for images for each language, 
     and downloads the first result.
     """
+    api_key, cse_id = load_credentials()
+
     print(f"--- Starting process for {json_file_path} ---")
 
     # Create the output directory if it doesn't exist
@@ -64,50 +148,15 @@ def download_images_for_json(json_file_path, output_folder):
         print(f"\nProcessing '{language_name}' ({iso_code})...")
         print(f"  -> Search query: {query}")
 
-        # 2. Make the API request to Google
-        search_url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            'q': query,
-            'cx': CSE_ID,
-            'key': API_KEY,
-            'searchType': 'image',
-            'num': 1, # We only want the top result
-            'imgSize': 'medium' 
-        }
-        
         try:
-            response = requests.get(search_url, params=params)
-            response.raise_for_status() 
-            search_results = response.json()
-
-            # 3. Get the image URL from the results
-            image_items = search_results.get('items')
-            if not image_items:
+            # 2. Make the API request to Google and take the top result
+            image_url = search_image_url(query, api_key, cse_id)
+            if not image_url:
                 print(f"  -> ⚠️ No image results found for '{query}'. Skipping.")
                 continue
 
-            image_url = image_items[0].get('link')
-            if not image_url:
-                print(f"  -> ⚠️ Found a result but it has no image link. Skipping.")
-                continue
-            
-            # 4. Download and save the image with the User-Agent header
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            image_response = requests.get(image_url, headers=headers, timeout=10)
-            image_response.raise_for_status()
-            
-            # Determine file extension, default to .jpg
-            file_extension = os.path.splitext(image_url)[1].split('?')[0]
-            if not file_extension or len(file_extension) > 5:
-                file_extension = '.jpg'
-
-            file_path = os.path.join(output_folder, f"{iso_code}{file_extension}")
-            
-            with open(file_path, 'wb') as f:
-                f.write(image_response.content)
-            
+            # 3. Download and save the image
+            file_path = download_image(image_url, output_folder, iso_code)
             print(f"  -> ✅ Success! Image saved to {file_path}")
 
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from asset_cache import AssetCache, map_with_cache
+from audit_images import AUDIT_CACHE_VERSION, inspect_image
+from catalog import IMAGE_EXTS, image_stem, iter_catalog_entries
+
+# Most endangered first: this is where a missing photo hurts the most
+ENDANGERMENT_RANK = {
+    "severely_endangered.json": 0,
+    "definitely_endangered.json": 1,
+    "data.json": 2,
+}
+
+# Missing images before images that exist but are broken
+REASON_RANK = {"missing": 0, "broken": 1}
+
+def quota_day():
+    """The Custom Search daily quota resets at midnight Pacific time"""
+    try:
+        return datetime.now(ZoneInfo("America/Los_Angeles")).date().isoformat()
+    except ZoneInfoNotFoundError:
+        return date.today().isoformat()
+
+def load_state(state_path):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"quota_day": None, "used": 0, "attempts": {}}
+
+def save_state(state_path, state):
+    state_path = Path(state_path)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_suffix(state_path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, state_path)
+
+def remaining_budget(state, daily_budget, today):
+    used = state["used"] if state["quota_day"] == today else 0
+    return max(0, daily_budget - used)
+
+def is_broken(facts, min_size):
+    """True if inspected image facts show it can't be decoded, is truncated or is too small"""
+    if facts["format"] is None or facts["truncated"] or facts["width"] is None:
+        return True
+    return min(facts["width"], facts["height"]) < min_size
+
+def should_retry(attempt, today, retry_after_days):
+    """Skip entries that already cost a request and can't succeed yet"""
+    if attempt is None:
+        return True
+    last_attempt = date.fromisoformat(attempt["last_attempt"])
+    if attempt["status"] in ("no_results", "rejected") or attempt["failures"] >= 3:
+        return (date.fromisoformat(today) - last_attempt) >= timedelta(days=retry_after_days)
+    return attempt["last_attempt"] != today
+
+def inspect_images_dir(images_dir, cache_path=None, jobs=None):
+    """
+    Inspect every file in images_dir, sharing the audit cache so unchanged
+    images are not read again. Returns {file name: facts}, keyed by the
+    names scandir reports so lookups match the files actually on disk.
+    """
+    images_path = Path(images_dir)
+    if not images_path.exists():
+        return {}
+    # Same file set as audit_images, so the shared cache isn't pruned back and forth
+    files = sorted(Path(entry.path) for entry in os.scandir(images_path)
+                   if entry.is_file() and not entry.name.startswith('.'))
+    cache = AssetCache(cache_path, version=AUDIT_CACHE_VERSION) if cache_path else None
+    facts_by_path, _ = map_with_cache(inspect_image, files, cache, jobs, root=images_path)
+    return {Path(path).name: facts for path, facts in facts_by_path.items()}
+
+def build_work_queue(images_dir, state, today, data_dir=".", min_size=200, retry_after_days=7,
+                     audit_cache_path=None, jobs=None):
+    """
+    One queue across all catalog files, ordered by missing-before-broken,
+    then endangerment, then smallest speaker community.
+    """
+    facts_by_name = inspect_images_dir(images_dir, audit_cache_path, jobs)
+    queue = []
+    seen = set()
+    for catalog_file, language, dialect, entry in iter_catalog_entries(data_dir):
+        stem = image_stem(language, dialect)
+        if stem in seen:
+            continue
+        seen.add(stem)
+
+        # Match real directory entries: on a case-insensitive filesystem is_file()
+        # would also accept x.jpg for x.JPG, a name the listing doesn't contain
+        image_name = next((stem + ext for ext in IMAGE_EXTS if stem + ext in facts_by_name), None)
+        if image_name is None:
+            reason = "missing"
+        elif is_broken(facts_by_name[image_name], min_size):
+            reason = "broken"
+        else:
+            continue
+
+        if not should_retry(state["attempts"].get(stem), today, retry_after_days):
+            continue
+
+        queue.append({
+            "stem": stem,
+            "catalog_file": catalog_file,
+            "entry": entry,
+            "reason": reason,
+        })
+
+    queue.sort(key=lambda item: (
+        REASON_RANK[item["reason"]],
+        ENDANGERMENT_RANK.get(item["catalog_file"], len(ENDANGERMENT_RANK)),
+        item["entry"].get("speakers") or 0,
+        item["stem"],
+    ))
+    return queue
+
+def record_attempt(state, stem, status, today):
+    previous = state["attempts"].get(stem, {})
+    failures = 0 if status == "downloaded" else previous.get("failures", 0) + 1
+    state["attempts"][stem] = {"status": status, "last_attempt": today, "failures": failures}
+
+def is_quota_error(error):
+    response = getattr(error, 'response', None)
+    if response is None:
+        return False
+    return response.status_code == 429 or (response.status_code == 403 and 'quota' in response.text.lower())
+
+def run_image_schedule(images_dir, state_path, daily_budget=100, data_dir=".", min_size=200,
+                       retry_after_days=7, dry_run=False, delay=1, audit_cache_path=None, jobs=None):
+    """
+    Spend today's remaining Custom Search budget on the highest-priority
+    entries, saving state after every request so the next day resumes.
+    """
+    state = load_state(state_path)
+    today = quota_day()
+    remaining = remaining_budget(state, daily_budget, today)
+    queue = build_work_queue(images_dir, state, today, data_dir, min_size, retry_after_days,
+                             audit_cache_path, jobs)
+
+    print(f"Quota day {today}: {remaining}/{daily_budget} requests left, {len(queue)} entries queued")
+    if dry_run:
+        for item in queue[:remaining]:
+            print(f"  would fetch {item['stem']} ({item['reason']}, {item['catalog_file']})")
+        return state
+
+    if not queue or not remaining:
+        return state
+
+    import requests
+    from image_download import build_search_query, download_image, load_credentials, search_image_url
+
+    api_key, cse_id = load_credentials()
+    Path(images_dir).mkdir(parents=True, exist_ok=True)
+
+    for item in queue[:remaining]:
+        stem = item["stem"]
+        query = build_search_query(item["entry"])
+        print(f"\nProcessing '{stem}' ({item['reason']}, {item['catalog_file']})...")
+        print(f"  -> Search query: {query}")
+
+        if state["quota_day"] != today:
+            state["quota_day"], state["used"] = today, 0
+
+        try:
+            image_url = search_image_url(query, api_key, cse_id)
+        except requests.exceptions.RequestException as e:
+            if is_quota_error(e):
+                print("  -> ❌ Daily quota exhausted, stopping until tomorrow")
+                state["used"] = daily_budget
+                save_state(state_path, state)
+                break
+            print(f"  -> ❌ ERROR searching for '{stem}': {e}")
+            if getattr(e, 'response', None) is not None:
+                # The API answered, so the request counted against the quota
+                state["used"] += 1
+            record_attempt(state, stem, "error", today)
+            save_state(state_path, state)
+            continue
+
+        state["used"] += 1
+        if not image_url:
+            print(f"  -> ⚠️ No image results found for '{query}'. Retrying in {retry_after_days} days.")
+            record_attempt(state, stem, "no_results", today)
+        else:
+            try:
+                file_path = download_image(image_url, images_dir, stem)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"  -> ❌ ERROR downloading {image_url}: {e}")
+                record_attempt(state, stem, "error", today)
+            else:
+                _, _, facts = inspect_image((file_path, None, None))
+                if is_broken(facts, min_size):
+                    # Same query tomorrow would likely return the same image
+                    print(f"  -> ⚠️ Saved {file_path} but it is truncated or under {min_size}px. "
+                          f"Retrying in {retry_after_days} days.")
+                    record_attempt(state, stem, "rejected", today)
+                else:
+                    print(f"  -> ✅ Success! Image saved to {file_path}")
+                    record_attempt(state, stem, "downloaded", today)
+        save_state(state_path, state)
+
+        time.sleep(delay)
+
+    print(f"\nUsed {state['used']}/{daily_budget} requests on {today}")
+    return state
+
+def main():
+    run_image_schedule("images_data", "../../.cache/image_scheduler.json",
+                       audit_cache_path="../../.cache/image_audit.json")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the Language Garden data pipeline.
+
+    python public/data/languagegarden.py <command> [options]
+
+Every pipeline script is imported only inside the subcommand that needs it,
+so heavy SDKs (elevenlabs, pinterest_dl, requests) and credential checks are
+never paid for by quick commands such as fix-names. Pass --timing to print
+how long startup and the command itself took.
+"""
+import time
+
+_STARTED_AT = time.perf_counter()
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent
+REPO_ROOT = DATA_DIR.parent.parent
+CACHE_DIR = REPO_ROOT / ".cache"
+
+CATALOG_FILES = {
+    "data": "data.json",
+    "definitely_endangered": "definitely_endangered.json",
+    "severely_endangered": "severely_endangered.json",
+}
+
+# --- COMMANDS ---
+
+def republish_catalog(args):
+    """Keep published catalog versions in step with commands that rewrite the catalog files"""
+    if args.no_publish:
+        return
+    from catalog_versions import republish_if_versioned
+
+    republish_if_versioned()
+
+def fetch_voices(args):
+    """Fetch the shared ElevenLabs voice library into voices.json"""
+    import create_voices_json
+
+    create_voices_json.main()
+
+def join(args):
+    """Inner-join voices, coordinates, names, speakers and isos into data.json"""
+    import join_data_jsons
+
+    join_data_jsons.join_voices_coordinates_and_names()
+    republish_catalog(args)
+
+def coordinates(args):
+    """Create a coordinates.json skeleton from voices.json"""
+    import create_coordinates_json
+
+    create_coordinates_json.create_coordinates_json()
+
+def download_images(args):
+    """Download one Custom Search image per language of a catalog file"""
+    import image_download
+
+    output_folder = args.output or f"images_{args.catalog}"
+    image_download.download_images_for_json(CATALOG_FILES[args.catalog], output_folder)
+
+def scrape(args):
+    """Download Pinterest candidates for every cached search query"""
+    import scraper_images
+
+    scraper_images.download_with_pinterest_dl(scraper_images.cached_search_queries, args.output)
+
+def organize(args):
+    """Link or copy the chosen Pinterest download of each folder into images_data"""
+    from organize_pinterest_images import organize_pinterest_images
+
+    organize_pinterest_images(args.source, args.target, incremental=not args.full,
+                              link_mode=args.link_mode, jobs=args.jobs)
+
+def fix_names(args):
+    """Fix _standard_standard duplicates and roll back 3-letter ISO image names"""
+    from cleanup_double_standard import cleanup_double_standard
+
+    for directory in args.cleanup_dirs:
+        print(f"\nCleaning up directory: {directory}")
+        print("=" * 50)
+        cleanup_double_standard(directory)
+
+    if args.skip_rollback:
+        return
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.append(str(REPO_ROOT))
+    from fix_spaced_rollback import create_spaced_rollback_mapping, rollback_spaced_images
+
+    print(f"\nRolling back spaced dialect images in {args.images_dir}...")
+    rollback_mapping = create_spaced_rollback_mapping("data.json")
+    rollback_spaced_images(args.images_dir, rollback_mapping)
+
+def audit(args):
+    """Check images_data against file names and the catalog"""
+    import json
+    from audit_images import audit_images, print_report
+    from catalog_versions import check_published
+
+    cache_path = None if args.no_cache else CACHE_DIR / "image_audit.json"
+    report = audit_images(args.images_dir, cache_path=cache_path, min_size=args.min_size, jobs=args.jobs)
+    if report is None:
+        return 1
+
+    print_report(report)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Saved to {args.report}")
+
+    published = check_published()
+    return 1 if report["problems"] or report["missing"] or report["orphans"] or not published else 0
+
+def placeholders(args):
+    """Embed a colour + tiny thumbnail placeholder in every catalog entry with an image"""
+    from placeholders import build_placeholders
+
+    cache_path = None if args.no_cache else CACHE_DIR / "placeholders.json"
+    build_placeholders(args.images_dir, cache_path=cache_path, jobs=args.jobs)
+    republish_catalog(args)
+
+def sprites(args):
+    """Pack catalog image thumbnails into Mapbox sprite sheets for map markers"""
+    from sprite_atlas import build_sprite_atlas
+
+    cache_path = None if args.no_cache else CACHE_DIR / "sprite_thumbnails.json"
+    build_sprite_atlas(args.images_dir, args.output, cache_path=cache_path, jobs=args.jobs)
+
+def publish(args):
+    """Snapshot the catalog and emit deltas from recent versions for returning clients"""
+    from catalog_versions import publish_catalog_version
+
+    publish_catalog_version(versions_dir=args.versions_dir, keep=args.keep)
+
+def schedule_images(args):
+    """Spend today's Custom Search budget on the most important missing or broken images"""
+    from image_scheduler import run_image_schedule
+
+    run_image_schedule(args.images_dir, args.state or CACHE_DIR / "image_scheduler.json",
+                       daily_budget=args.budget, min_size=args.min_size,
+                       retry_after_days=args.retry_after_days, dry_run=args.dry_run,
+                       audit_cache_path=CACHE_DIR / "image_audit.json", jobs=args.jobs)
+
+def mock_services(args):
+    """Serve recorded or synthetic ElevenLabs, Custom Search and Pinterest responses locally"""
+    from mock_services import serve
+
+    serve(args.host, args.port, fixture_path=args.fixture, latency_ms=args.latency_ms,
+          jitter_ms=args.jitter_ms, error_rate=args.error_rate, rate_limit=args.rate_limit,
+          burst=args.burst, seed=args.seed, synthetic=args.synthetic,
+          synthetic_image_size=args.synthetic_image_size, record=args.record)
+
+# --- CLI ---
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="languagegarden", description="Language Garden data pipeline")
+    parser.add_argument("--data-dir", default=str(DATA_DIR),
+                        help="Directory holding the catalog JSON files (default: this script's folder)")
+    parser.add_argument("--timing", action="store_true",
+                        help="Print startup and command wall time to stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("fetch-voices", help=fetch_voices.__doc__).set_defaults(handler=fetch_voices)
+    command = subparsers.add_parser("join", help=join.__doc__)
+    command.add_argument("--no-publish", action="store_true",
+                         help="Don't publish a new catalog version afterwards")
+    command.set_defaults(handler=join)
+    subparsers.add_parser("coordinates", help=coordinates.__doc__).set_defaults(handler=coordinates)
+
+    command = subparsers.add_parser("download-images", help=download_images.__doc__)
+    command.add_argument("--catalog", choices=sorted(CATALOG_FILES), default="data")
+    command.add_argument("--output", help="Output folder (default: images_<catalog>)")
+    command.set_defaults(handler=download_images)
+
+    command = subparsers.add_parser("schedule-images", help=schedule_images.__doc__)
+    command.add_argument("--images-dir", default="images_data")
+    command.add_argument("--budget", type=int, default=100,
+                         help="Custom Search requests allowed per day (free tier: 100)")
+    command.add_argument("--min-size", type=int, default=200,
+                         help="Existing images smaller than this are re-fetched")
+    command.add_argument("--retry-after-days", type=int, default=7,
+                         help="Wait before re-querying entries that returned no results")
+    command.add_argument("--state", help="State file (default: .cache/image_scheduler.json)")
+    command.add_argument("--dry-run", action="store_true", help="Show the plan without making requests")
+    command.add_argument("--jobs", type=int, help="Worker processes for inspecting images (default: CPU count)")
+    command.set_defaults(handler=schedule_images)
+
+    command = subparsers.add_parser("scrape", help=scrape.__doc__)
+    command.add_argument("--output", default="images_from_pinterest_dl")
+    command.set_defaults(handler=scrape)
+
+    command = subparsers.add_parser("organize", help=organize.__doc__)
+    command.add_argument("--source", default="images_from_pinterest_dl")
+    command.add_argument("--target", default="images_data")
+    command.add_argument("--link-mode", choices=["auto", "hardlink", "reflink", "copy"], default="auto",
+                         help="auto tries reflink, copy_file_range, then a plain copy; "
+                              "hardlink shares the file with the scrape tree")
+    command.add_argument("--full", action="store_true", help="Re-place every target, even unchanged ones")
+    command.add_argument("--jobs", type=int, help="Folders processed in parallel")
+    command.set_defaults(handler=organize)
+
+    command = subparsers.add_parser("fix-names", help=fix_names.__doc__)
+    command.add_argument("--cleanup-dirs", nargs="*",
+                         default=["images_definitely_endangered", "images_severely_endangered"])
+    command.add_argument("--images-dir", default="images_data")
+    command.add_argument("--skip-rollback", action="store_true")
+    command.set_defaults(handler=fix_names)
+
+    command = subparsers.add_parser("audit", help=audit.__doc__)
+    command.add_argument("--images-dir", default="images_data")
+    command.add_argument("--min-size", type=int, default=200,
+                         help="Smallest acceptable width/height in pixels")
+    command.add_argument("--jobs", type=int, help="Worker processes (default: CPU count)")
+    command.add_argument("--no-cache", action="store_true", help="Re-inspect every file")
+    command.add_argument("--report", help="Also write the report as JSON to this file")
+    command.set_defaults(handler=audit)
+
+    command = subparsers.add_parser("placeholders", help=placeholders.__doc__)
+    command.add_argument("--no-publish", action="store_true",
+                         help="Don't publish a new catalog version afterwards")
+    command.add_argument("--images-dir", default="images_data")
+    command.add_argument("--jobs", type=int, help="Worker processes (default: CPU count)")
+    command.add_argument("--no-cache", action="store_true", help="Recompute every placeholder")
+    command.set_defaults(handler=placeholders)
+
+    command = subparsers.add_parser("sprites", help=sprites.__doc__)
+    command.add_argument("--images-dir", default="images_data")
+    command.add_argument("--output", default="sprites")
+    command.add_argument("--jobs", type=int, help="Worker processes (default: CPU count)")
+    command.add_argument("--no-cache", action="store_true", help="Resize every thumbnail again")
+    command.set_defaults(handler=sprites)
+
+    command = subparsers.add_parser("publish", help=publish.__doc__)
+    command.add_argument("--versions-dir", default="catalog_versions")
+    command.add_argument("--keep", type=int, default=5,
+                         help="How many previous versions get a delta to the new one")
+    command.set_defaults(handler=publish)
+
+    command = subparsers.add_parser("mock-services", help=mock_services.__doc__)
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8787)
+    command.add_argument("--fixture", help="Fixture JSON to replay (and to write to with --record)")
+    command.add_argument("--record", action="store_true",
+                         help="Forward ElevenLabs and Custom Search fixture misses to the real services "
+                              "and save their responses (Pinterest is not recorded)")
+    command.add_argument("--synthetic", action="store_true",
+                         help="Answer fixture misses with generated voices, search results and images")
+    command.add_argument("--synthetic-image-size", type=int, default=256, help="Side of generated images in px")
+    command.add_argument("--latency-ms", type=float, default=0)
+    command.add_argument("--jitter-ms", type=float, default=0)
+    command.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered with 500/503")
+    command.add_argument("--rate-limit", type=float, default=0, help="Requests per second per service before 429s (0: unlimited)")
+    command.add_argument("--burst", type=int, default=10)
+    command.add_argument("--seed", type=int, default=0)
+    command.set_defaults(handler=mock_services)
+
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "mock-services" and args.record and not args.fixture:
+        parser.error("mock-services --record needs --fixture to save the recording to")
+
+    # The pipeline scripts live next to this file and use paths relative to the data folder
+    if str(DATA_DIR) not in sys.path:
+        sys.path.insert(0, str(DATA_DIR))
+    os.chdir(args.data_dir)
+
+    dispatched_at = time.perf_counter()
+    try:
+        return args.handler(args)
+    finally:
+        if args.timing:
+            finished_at = time.perf_counter()
+            print(f"startup: {(dispatched_at - _STARTED_AT) * 1000:.1f} ms, "
+                  f"{args.command}: {(finished_at - dispatched_at) * 1000:.1f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    sys.exit(main())
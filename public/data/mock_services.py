@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Local record/replay stand-in for ElevenLabs, Google Custom Search and Pinterest.
+
+The fetchers read their base URL from the environment, so pointing them here
+lets concurrency, retry and caching changes be load-tested offline:
+
+    ELEVENLABS_BASE_URL=http://127.0.0.1:8787
+    CSE_BASE_URL=http://127.0.0.1:8787
+    PINTEREST_BASE_URL=http://127.0.0.1:8787
+
+Latency, error rate and 429 rate limiting are configurable and seeded, so the
+same run against the same fixture sees the same behaviour. GET /__stats
+reports request counts, statuses and latency percentiles per service.
+"""
+import base64
+import hashlib
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import Request, urlopen
+
+UPSTREAMS = {
+    "elevenlabs": "https://api.elevenlabs.io",
+    "cse": "https://www.googleapis.com",
+}
+
+SERVICES = ["elevenlabs", "cse", "pinterest", "images"]
+
+def empty_fixture():
+    return {"elevenlabs": {"pages": {}}, "cse": {}, "pinterest": {}, "images": {}}
+
+def load_fixture(fixture_path):
+    try:
+        with open(fixture_path, 'r', encoding='utf-8') as f:
+            fixture = json.load(f)
+    except FileNotFoundError:
+        return empty_fixture()
+    for key, value in empty_fixture().items():
+        fixture.setdefault(key, value)
+    return fixture
+
+def synthetic_png(name, size):
+    """Deterministic noise PNG, so byte counts resemble real photos"""
+    rng = random.Random(name)
+    rows = b''.join(b'\x00' + rng.randbytes(size * 3) for _ in range(size))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    header = struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows, 1)) + chunk(b'IEND', b''))
+
+def synthetic_voices(voices_json_path):
+    """Shared-voice records rebuilt from voices.json (language -> accent -> [voice_ids])"""
+    try:
+        with open(voices_json_path, 'r', encoding='utf-8') as f:
+            voices = json.load(f)
+    except FileNotFoundError:
+        return []
+
+    return [{
+        "public_owner_id": "synthetic",
+        "voice_id": voice_id,
+        "date_unix": 0,
+        "name": f"{language} {accent} {index}",
+        "accent": accent,
+        "gender": "neutral",
+        "age": "middle_aged",
+        "descriptive": "calm",
+        "use_case": "conversational",
+        "category": "professional",
+        "language": language,
+        "description": "Synthetic voice served by mock_services.py",
+        "preview_url": None,
+        "usage_character_count_1y": 0,
+        "usage_character_count_7d": 0,
+        "cloned_by_count": 0,
+        "free_users_allowed": True,
+        "live_moderation_enabled": False,
+        "featured": False,
+    } for language, accents in voices.items()
+        for accent, voice_ids in accents.items()
+        for index, voice_id in enumerate(voice_ids)]
+
+class TokenBucket:
+    """Requests per second with a burst allowance; 0 disables limiting"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        if not self.rate:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+class ReplayState:
+    def __init__(self, fixture_path=None, latency_ms=0, jitter_ms=0, error_rate=0.0, rate_limit=0,
+                 burst=10, seed=0, synthetic=False, synthetic_image_size=256, voices_json="voices.json",
+                 record=False):
+        if record and not fixture_path:
+            raise ValueError("record mode needs a fixture_path to save responses to")
+        self.fixture_path = Path(fixture_path) if fixture_path else None
+        self.fixture = load_fixture(self.fixture_path) if self.fixture_path else empty_fixture()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        # One bucket per service, so image downloads don't eat the search limits
+        self.buckets = {service: TokenBucket(rate_limit, burst) for service in SERVICES}
+        self.seed = seed
+        self.synthetic = synthetic
+        self.synthetic_image_size = synthetic_image_size
+        self.record = record
+
+        self.lock = threading.Lock()
+        self.request_counts = {}
+        self.stats = {}
+        self.image_cache = {}
+        self.voices = synthetic_voices(voices_json) if synthetic else []
+
+    def request_rng(self, request_key):
+        """Seeded per request (and per repeat of it), independent of thread timing"""
+        with self.lock:
+            count = self.request_counts.get(request_key, 0)
+            self.request_counts[request_key] = count + 1
+        return random.Random(f"{self.seed}:{request_key}:{count}")
+
+    def record_stat(self, service, status, latency):
+        with self.lock:
+            service_stats = self.stats.setdefault(service, {"statuses": {}, "latencies_ms": []})
+            service_stats["statuses"][str(status)] = service_stats["statuses"].get(str(status), 0) + 1
+            service_stats["latencies_ms"].append(latency * 1000)
+
+    def summary(self):
+        with self.lock:
+            summary = {}
+            for service, service_stats in self.stats.items():
+                latencies = sorted(service_stats["latencies_ms"])
+                summary[service] = {
+                    "requests": len(latencies),
+                    "statuses": service_stats["statuses"],
+                    **{f"p{p}_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))], 1)
+                       for p in (50, 95, 99)},
+                }
+            return summary
+
+    def save_fixture(self):
+        """Handlers change the fixture only while holding the lock, so the dump sees a stable dict"""
+        if not self.fixture_path:
+            return
+        with self.lock:
+            self.fixture_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.fixture_path, 'w', encoding='utf-8') as f:
+                json.dump(self.fixture, f, indent=2, ensure_ascii=False)
+
+    def images_dir(self):
+        return self.fixture_path.with_name(f"{self.fixture_path.stem}_images")
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server_version = "LanguageGardenReplay/1.0"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass  # per-request logging would dominate benchmark output
+
+    def base_url(self):
+        return f"http://{self.headers.get('Host', '%s:%s' % self.server.server_address[:2])}"
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_bytes(self, content, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/__stats":
+            return self.send_json(200, self.state.summary())
+
+        routes = {
+            "/v1/shared-voices": ("elevenlabs", self.shared_voices),
+            "/customsearch/v1": ("cse", self.custom_search),
+            "/pinterest/search": ("pinterest", self.pinterest_search),
+        }
+        if url.path in routes:
+            service, route = routes[url.path]
+        elif url.path.startswith("/images/"):
+            service, route = "images", self.image
+        else:
+            return self.send_json(404, {"error": f"No route for {url.path}"})
+
+        started_at = time.perf_counter()
+        status = self.serve(service, route, url, query)
+        self.state.record_stat(service, status, time.perf_counter() - started_at)
+
+    def serve(self, service, route, url, query):
+        if not self.state.buckets[service].take():
+            self.send_json(429, {"error": {"code": 429, "message": "Rate limit exceeded"}}, {"Retry-After": "1"})
+            return 429
+
+        rng = self.state.request_rng(f"{url.path}?{url.query}")
+        delay_ms = self.state.latency_ms + rng.uniform(-1, 1) * self.state.jitter_ms
+        time.sleep(max(0.0, delay_ms) / 1000)
+
+        if rng.random() < self.state.error_rate:
+            status = rng.choice([500, 503])
+            self.send_json(status, {"error": {"code": status, "message": "Injected failure"}})
+            return status
+
+        try:
+            return route(url, query)
+        except Exception as e:
+            # Typically a failed upstream fetch while recording
+            self.send_json(502, {"error": {"code": 502, "message": str(e)}})
+            return 502
+
+    # --- ElevenLabs ---
+
+    def shared_voices(self, url, query):
+        page_size = int(query.get("page_size", 30))
+        page = int(query.get("page", 0))
+        page_key = f"{page_size}:{page}"
+        pages = self.state.fixture["elevenlabs"]["pages"]
+
+        if self.state.record and page_key not in pages:
+            headers = {"xi-api-key": self.headers.get("xi-api-key", "")}
+            response = self.fetch_upstream_json(UPSTREAMS["elevenlabs"] + self.path, headers)
+            with self.state.lock:
+                pages[page_key] = response
+            self.state.save_fixture()
+
+        if page_key in pages:
+            self.send_json(200, pages[page_key])
+        elif not self.state.synthetic:
+            return self.send_miss(f"shared-voices page {page_key}")
+        else:
+            voices = self.state.voices[page * page_size:(page + 1) * page_size]
+            self.send_json(200, {
+                "voices": voices,
+                "has_more": (page + 1) * page_size < len(self.state.voices),
+                "last_sort_id": None,
+            })
+        return 200
+
+    # --- Google Custom Search ---
+
+    def custom_search(self, url, query):
+        search_query = query.get("q", "")
+        responses = self.state.fixture["cse"]
+
+        if self.state.record and search_query not in responses:
+            response = self.fetch_upstream_json(f"{UPSTREAMS['cse']}{url.path}?{url.query}")
+            for item in response.get("items", []):
+                item["link"] = self.register_image(item["link"])
+            with self.state.lock:
+                responses[search_query] = response
+            self.state.save_fixture()
+
+        if search_query in responses:
+            response = json.loads(json.dumps(responses[search_query]))
+        elif self.state.synthetic:
+            response = {"items": [{"link": self.synthetic_image_path(search_query, 0)}]}
+        else:
+            return self.send_miss(f"search {search_query!r}")
+
+        for item in response.get("items", []):
+            if item.get("link", "").startswith("/"):
+                item["link"] = self.base_url() + item["link"]
+        self.send_json(200, response)
+        return 200
+
+    # --- Pinterest ---
+
+    def pinterest_search(self, url, query):
+        search_query = query.get("q", "")
+        num = int(query.get("num", 1))
+
+        if search_query in self.state.fixture["pinterest"]:
+            paths = [f"/images/{image_id}" for image_id in self.state.fixture["pinterest"][search_query][:num]]
+        elif self.state.synthetic:
+            paths = [self.synthetic_image_path(search_query, index) for index in range(num)]
+        else:
+            # Not recorded even with --record: Pinterest has no public search API to forward to
+            return self.send_miss(f"Pinterest search {search_query!r}")
+
+        self.send_json(200, {"images": [self.base_url() + path for path in paths]})
+        return 200
+
+    # --- Images ---
+
+    def synthetic_image_path(self, query, index):
+        image_id = hashlib.sha1(f"{query}:{index}".encode('utf-8')).hexdigest()[:16]
+        return f"/images/synthetic-{image_id}.png"
+
+    def register_image(self, upstream_url):
+        """Record mode: remember an upstream image URL under a local id"""
+        image_id = hashlib.sha1(upstream_url.encode('utf-8')).hexdigest()[:16]
+        with self.state.lock:
+            self.state.fixture["images"].setdefault(image_id, {"url": upstream_url})
+        return f"/images/{image_id}"
+
+    def image(self, url, query):
+        image_id = url.path[len("/images/"):]
+
+        if image_id.startswith("synthetic-"):
+            with self.state.lock:
+                content = self.state.image_cache.get(image_id)
+            if content is None:
+                content = synthetic_png(image_id, self.state.synthetic_image_size)
+                with self.state.lock:
+                    self.state.image_cache[image_id] = content
+            self.send_bytes(content, 'image/png')
+            return 200
+
+        entry = self.state.fixture["images"].get(image_id)
+        if entry is None:
+            return self.send_miss(f"image {image_id}")
+        if isinstance(entry, str):
+            entry = {"file": entry}  # hand-written shorthand: a path relative to the fixture
+
+        if "file" not in entry and "base64" not in entry and self.state.record:
+            with urlopen(Request(entry["url"], headers={'User-Agent': 'Mozilla/5.0'}), timeout=30) as response:
+                content = response.read()
+                content_type = response.headers.get('Content-Type', 'application/octet-stream')
+            image_file = self.state.images_dir() / image_id
+            image_file.parent.mkdir(parents=True, exist_ok=True)
+            image_file.write_bytes(content)
+            with self.state.lock:
+                entry["content_type"] = content_type
+                entry["file"] = str(image_file.relative_to(self.state.fixture_path.parent))
+            self.state.save_fixture()
+
+        if "file" in entry:
+            content = (self.state.fixture_path.parent / entry["file"]).read_bytes()
+        elif "base64" in entry:
+            content = base64.b64decode(entry["base64"])
+        else:
+            self.send_json(404, {"error": f"Image {image_id} was never recorded"})
+            return 404
+
+        self.send_bytes(content, entry.get("content_type", 'application/octet-stream'))
+        return 200
+
+    def send_miss(self, what):
+        """Replay-only runs fail loudly on anything the fixture doesn't cover"""
+        self.send_json(404, {"error": {"code": 404, "message": f"No fixture entry for {what}"}})
+        return 404
+
+    def fetch_upstream_json(self, upstream_url, headers=None):
+        with urlopen(Request(upstream_url, headers=headers or {}), timeout=30) as response:
+            return json.load(response)
+
+def serve(host="127.0.0.1", port=8787, **options):
+    """Run the replay server until interrupted"""
+    server = ThreadingHTTPServer((host, port), ReplayHandler)
+    server.daemon_threads = True
+    server.state = ReplayState(**options)
+
+    mode = "recording" if options.get("record") else "replaying"
+    print(f"Mock services {mode} on http://{host}:{port}")
+    print(f"  ELEVENLABS_BASE_URL=http://{host}:{port}")
+    print(f"  CSE_BASE_URL=http://{host}:{port}")
+    print(f"  PINTEREST_BASE_URL=http://{host}:{port}")
+    print(f"  Stats: http://{host}:{port}/__stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.state.summary(), indent=2))
+    return server.state
+
+def main():
+    serve(fixture_path="mock_fixture.json", synthetic=True)
+
+if __name__ == "__main__":
+    main()
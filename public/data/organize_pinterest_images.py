@@ -1,13 +1,142 @@
 #!/usr/bin/env python3
 
+import errno
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def organize_pinterest_images(source_dir, target_dir):
+from asset_cache import file_digest
+
+IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP']
+
+# Linux ioctl that makes dst share src's extents on CoW filesystems (btrfs, XFS)
+FICLONE = 0x40049409
+
+def is_unchanged(source, target, shared_ok=False):
+    """
+    True if target already holds the same bytes as source.
+    A target hardlinked to source only counts with shared_ok, since
+    re-scraping the source would otherwise rewrite it through the link.
+    """
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+
+    if (source_stat.st_dev, source_stat.st_ino) == (target_stat.st_dev, target_stat.st_ino):
+        return shared_ok  # already hardlinked
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return True
+    if file_digest(source) != file_digest(target):
+        return False
+    # Same bytes after a touch: adopt the source mtime so later runs take the stat-only path
+    os.utime(target, ns=(target_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+def _reflink(source, destination):
+    import fcntl
+
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+def _copy_file_range(source, destination):
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
+def place_file(source, target, link_mode="auto"):
+    """
+    Put source's bytes at target without a userspace byte copy when possible:
+    reflink, then in-kernel copy_file_range, then copy2. Hardlinks are only
+    used when asked for, because the scrape tree is rewritten in place.
+    Returns the method that worked. The target is replaced atomically.
+    """
+    tmp_target = target.with_name(f".{target.name}.tmp")
+    tmp_target.unlink(missing_ok=True)
+
+    strategies = {
+        "hardlink": [("hardlink", os.link)],
+        "reflink": [("reflink", _reflink)],
+        "copy": [("copy", shutil.copy2)],
+    }.get(link_mode)
+    if strategies is None:
+        strategies = []
+        if sys.platform.startswith('linux'):
+            strategies.append(("reflink", _reflink))
+        if hasattr(os, 'copy_file_range'):
+            strategies.append(("copy_file_range", _copy_file_range))
+        strategies.append(("copy", shutil.copy2))
+
+    for index, (method, place) in enumerate(strategies):
+        try:
+            place(source, tmp_target)
+        except OSError as e:
+            tmp_target.unlink(missing_ok=True)
+            # Cross-device, unsupported filesystem or not permitted: try the next method
+            if index + 1 < len(strategies) and e.errno in (
+                    errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EMLINK):
+                continue
+            raise
+        if method in ("reflink", "copy_file_range"):
+            # Keep the source mtime so the next incremental run takes the fast path
+            shutil.copystat(source, tmp_target)
+        os.replace(tmp_target, target)
+        # rename() is a no-op when both names are links to the same file
+        tmp_target.unlink(missing_ok=True)
+        return method
+
+def organize_subfolder(subdir, target_path, incremental=True, link_mode="auto"):
+    """
+    Place the image of one Pinterest subfolder at target_path/<subfolder>.png.
+    Returns (status, message) with status in placed/unchanged/skipped/error.
+    """
+    subfolder_name = subdir.name
+
+    # Find image files in the subdirectory (skip .DS_Store and other hidden files)
+    with os.scandir(subdir) as entries:
+        image_files = sorted(Path(entry.path) for entry in entries
+                             if entry.is_file() and not entry.name.startswith('.')
+                             and os.path.splitext(entry.name)[1] in IMAGE_EXTENSIONS)
+
+    if not image_files:
+        return "skipped", f"  ⚠️  No image files found in {subfolder_name}"
+
+    message = ""
+    if len(image_files) > 1:
+        message = f"  ⚠️  Multiple images found in {subfolder_name}, using the first one: {image_files[0].name}\n"
+
+    # Take the first (and usually only) image file
+    source_image = image_files[0]
+
+    # Create target filename with .png extension
+    target_filename = f"{subfolder_name}.png"
+    target_image = target_path / target_filename
+
+    try:
+        if incremental and is_unchanged(source_image, target_image, shared_ok=link_mode == "hardlink"):
+            return "unchanged", message + f"  = {target_filename} is up to date"
+
+        method = place_file(source_image, target_image, link_mode)
+        return "placed", message + f"  ✓ {source_image.name} -> {target_filename} ({method})"
+
+    except Exception as e:
+        return "error", message + f"  ✗ Error processing {subfolder_name}: {e}"
+
+def organize_pinterest_images(source_dir, target_dir, incremental=True, link_mode="auto", jobs=None):
     """
     Organize images from Pinterest download subfolders into a single images_data folder.
     Each subfolder contains one image which will be renamed to match the subfolder name.
+    Folders are processed in parallel; with incremental=True targets that already
+    hold the same bytes are left alone.
     """
     source_path = Path(source_dir)
     target_path = Path(target_dir)
@@ -19,58 +148,29 @@ def organize_pinterest_images(source_dir, target_dir):
     # Create target directory if it doesn't exist
     target_path.mkdir(parents=True, exist_ok=True)
 
-    # Get all subdirectories
-    subdirs = [d for d in source_path.iterdir() if d.is_dir()]
+    # Get all subdirectories, skipping hidden ones
+    with os.scandir(source_path) as entries:
+        subdirs = sorted(Path(entry.path) for entry in entries
+                         if entry.is_dir() and not entry.name.startswith('.'))
 
     print(f"Found {len(subdirs)} subdirectories to process")
 
-    processed = 0
-    skipped = 0
-    errors = 0
-
-    for subdir in subdirs:
-        subfolder_name = subdir.name
-
-        # Skip hidden directories
-        if subfolder_name.startswith('.'):
-            continue
-
-        print(f"Processing: {subfolder_name}")
-
-        # Find image files in the subdirectory (skip .DS_Store and other hidden files)
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP']
-        image_files = [f for f in subdir.iterdir()
-                      if f.is_file() and f.suffix in image_extensions and not f.name.startswith('.')]
-
-        if not image_files:
-            print(f"  ⚠️  No image files found in {subfolder_name}")
-            skipped += 1
-            continue
-
-        if len(image_files) > 1:
-            print(f"  ⚠️  Multiple images found in {subfolder_name}, using the first one: {image_files[0].name}")
-
-        # Take the first (and usually only) image file
-        source_image = image_files[0]
-
-        # Create target filename with .png extension
-        target_filename = f"{subfolder_name}.png"
-        target_image = target_path / target_filename
-
-        try:
-            # Copy the image to the target directory with the new name
-            shutil.copy2(source_image, target_image)
-            print(f"  ✓ Copied {source_image.name} -> {target_filename}")
-            processed += 1
+    counts = {"placed": 0, "unchanged": 0, "skipped": 0, "error": 0}
 
-        except Exception as e:
-            print(f"  ✗ Error processing {subfolder_name}: {e}")
-            errors += 1
+    # File placement is I/O bound, so threads are enough
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(lambda subdir: organize_subfolder(subdir, target_path, incremental, link_mode), subdirs)
+        for subdir, (status, message) in zip(subdirs, results):
+            counts[status] += 1
+            if status != "unchanged":
+                print(f"Processing: {subdir.name}")
+                print(message)
 
     print(f"\nSummary:")
-    print(f"  Processed: {processed}")
-    print(f"  Skipped: {skipped}")
-    print(f"  Errors: {errors}")
+    print(f"  Processed: {counts['placed']}")
+    print(f"  Unchanged: {counts['unchanged']}")
+    print(f"  Skipped: {counts['skipped']}")
+    print(f"  Errors: {counts['error']}")
     print(f"  Total subdirectories: {len(subdirs)}")
 
 def main():
@@ -87,4 +187,4 @@ def main():
     print("\nOrganization complete!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import base64
+import hashlib
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from asset_cache import AssetCache, map_with_cache
+from catalog import CATALOG_FILES, find_catalog_image, image_stem, load_catalog
+
+# Bump when the placeholder format changes so every image is recomputed
+PLACEHOLDER_CACHE_VERSION = 1
+
+# Longest side of the embedded thumbnail, in pixels
+THUMBNAIL_SIZE = 8
+
+def downsample(pixels, size=THUMBNAIL_SIZE):
+    """
+    Box-filter an (h, w, 3) array so its longest side is at most `size`,
+    averaging each block of pixels in one vectorized reshape.
+    """
+    height, width = pixels.shape[:2]
+    block = max(1, -(-max(height, width) // size))
+    thumb_height, thumb_width = max(1, height // block), max(1, width // block)
+    block_y, block_x = height // thumb_height, width // thumb_width
+
+    cropped = pixels[:thumb_height * block_y, :thumb_width * block_x]
+    return cropped.reshape(thumb_height, block_y, thumb_width, block_x, 3).mean(axis=(1, 3))
+
+def encode_thumbnail(thumbnail):
+    """Encode a small float RGB array as a PNG data URL"""
+    buffer = io.BytesIO()
+    Image.fromarray(np.rint(thumbnail).astype(np.uint8), 'RGB').save(buffer, 'PNG', optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+def compute_placeholder(job):
+    """
+    Worker: average colour plus a few-pixel thumbnail for one image.
+    Skips decoding when the file hash matches the previous run.
+    """
+    path, previous_digest, previous_result = job
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == previous_digest:
+        return path, digest, previous_result
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # Let the JPEG decoder scale down while decoding; we only need a few pixels
+            image.draft('RGB', (THUMBNAIL_SIZE * 8, THUMBNAIL_SIZE * 8))
+            pixels = np.asarray(image.convert('RGB'), dtype=np.float32)
+    except Exception as e:
+        print(f"  ✗ Error decoding {Path(path).name}: {e}")
+        return path, digest, None
+
+    thumbnail = downsample(pixels)
+    red, green, blue = np.rint(thumbnail.reshape(-1, 3).mean(axis=0)).astype(int)
+    return path, digest, {
+        "color": f"#{red:02x}{green:02x}{blue:02x}",
+        "thumbnail": encode_thumbnail(thumbnail),
+    }
+
+def build_placeholders(images_dir, data_dir=".", cache_path=None, jobs=None):
+    """
+    Compute a placeholder for every catalog image and store it as the
+    "placeholder" field of the matching entry in each catalog file.
+    """
+    catalogs = {catalog_file: load_catalog(Path(data_dir) / catalog_file) for catalog_file in CATALOG_FILES}
+
+    images_by_entry = {}
+    for catalog_file, catalog in catalogs.items():
+        for language, dialects in catalog.items():
+            for dialect in dialects:
+                image_path = find_catalog_image(images_dir, image_stem(language, dialect))
+                if image_path:
+                    images_by_entry[(catalog_file, language, dialect)] = str(image_path)
+
+    image_paths = sorted(set(images_by_entry.values()))
+    cache = AssetCache(cache_path, version=PLACEHOLDER_CACHE_VERSION) if cache_path else None
+    placeholders, computed = map_with_cache(compute_placeholder, image_paths, cache, jobs, root=images_dir)
+    print(f"Placeholders for {len(image_paths)} images ({len(image_paths) - computed} cached, {computed} computed)")
+
+    for catalog_file, catalog in catalogs.items():
+        changed = 0
+        for language, dialects in catalog.items():
+            for dialect, entry in dialects.items():
+                image_path = images_by_entry.get((catalog_file, language, dialect))
+                placeholder = placeholders.get(image_path) if image_path else None
+
+                if placeholder is None and "placeholder" in entry:
+                    del entry["placeholder"]
+                    changed += 1
+                elif placeholder is not None and entry.get("placeholder") != placeholder:
+                    entry["placeholder"] = placeholder
+                    changed += 1
+
+        if changed:
+            with open(Path(data_dir) / catalog_file, 'w', encoding='utf-8') as f:
+                json.dump(catalog, f, indent=2, ensure_ascii=False)
+            print(f"  ✓ Updated {changed} entries in {catalog_file}")
+        else:
+            print(f"  {catalog_file} already up to date")
+
+def main():
+    build_placeholders("images_data", cache_path="../../.cache/placeholders.json")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 import os
 import time
-from pinterest_dl import PinterestDL
 
 # This is the revised dictionary of search queries.
 cached_search_queries = {
@@ -242,6 +241,36 @@ cached_search_queries = {
 
 problematic_queries = {'en_british': '"British people"'}
 
+class ReplayPinterestDL:
+    """
+    Stand-in for PinterestDL that talks to mock_services.py. pinterest-dl
+    has no base-URL setting, so offline runs swap the client instead.
+    """
+
+    def __init__(self, base_url, timeout=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def search_and_download(self, query, output_dir, num, min_resolution=None, delay=0):
+        import json
+        from urllib.parse import urlencode
+        from urllib.request import urlopen
+
+        search_url = f"{self.base_url}/pinterest/search?{urlencode({'q': query, 'num': num})}"
+        with urlopen(search_url, timeout=self.timeout) as response:
+            image_urls = json.load(response)["images"]
+
+        os.makedirs(output_dir, exist_ok=True)
+        downloaded = []
+        for index, image_url in enumerate(image_urls):
+            with urlopen(image_url, timeout=self.timeout) as response:
+                file_path = os.path.join(output_dir, f"{index}{os.path.splitext(image_url)[1] or '.jpg'}")
+                with open(file_path, 'wb') as f:
+                    f.write(response.read())
+            downloaded.append(file_path)
+            time.sleep(delay)
+        return downloaded
+
 def download_with_pinterest_dl(queries_dict, main_output_folder):
     """
     Loops through a dictionary of queries and uses pinterest-dl to download
@@ -254,11 +283,18 @@ def download_with_pinterest_dl(queries_dict, main_output_folder):
         print(f"Created main directory: {main_output_folder}")
     
     # Initialize the downloader once with your preferred settings
-    downloader = PinterestDL.with_api(
-        timeout=10, 
-        verbose=False,
-        ensure_alt=False 
-    )
+    replay_base_url = os.getenv("PINTEREST_BASE_URL")
+    if replay_base_url:
+        print(f"Using replay server at {replay_base_url}")
+        downloader = ReplayPinterestDL(replay_base_url, timeout=10)
+    else:
+        from pinterest_dl import PinterestDL
+
+        downloader = PinterestDL.with_api(
+            timeout=10, 
+            verbose=False,
+            ensure_alt=False 
+        )
 
     for key, query in queries_dict.items():
         try:
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import base64
+import hashlib
+import io
+import json
+from pathlib import Path
+
+from PIL import Image
+
+from asset_cache import AssetCache, map_with_cache
+from catalog import find_catalog_image, image_stem, iter_catalog_entries
+
+# Bump when thumbnail settings change so every image is resized again
+SPRITE_CACHE_VERSION = 1
+
+# Thumbnails are rendered at 2x and shown at 32 logical px on the longest side
+PIXEL_RATIO = 2
+THUMBNAIL_SIZE = 64
+# Transparent gutter between sprites so texture filtering doesn't bleed
+PADDING = 2
+SHEET_SIZE = 2048
+# Sheets hold photos, so lossy WebP (which keeps the alpha gutters) is several times smaller than PNG
+SHEET_FORMAT = 'webp'
+SHEET_QUALITY = 85
+
+def make_thumbnail(job):
+    """
+    Worker: aspect-preserving RGBA thumbnail for one image, as base64 PNG.
+    Skips decoding when the file hash matches the previous run.
+    """
+    path, previous_digest, previous_result = job
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == previous_digest:
+        return path, digest, previous_result
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.draft('RGB', (THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2))
+            thumbnail = image.convert('RGBA')
+            thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.LANCZOS)
+    except Exception as e:
+        print(f"  ✗ Error decoding {Path(path).name}: {e}")
+        return path, digest, None
+
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, 'PNG', optimize=True)
+    return path, digest, {
+        "width": thumbnail.width,
+        "height": thumbnail.height,
+        "png": base64.b64encode(buffer.getvalue()).decode('ascii'),
+    }
+
+def shelf_pack(sizes, sheet_size=SHEET_SIZE, padding=PADDING):
+    """
+    Shelf bin-packing (first fit, decreasing height): sprites are sorted by
+    height and dropped onto the first shelf with room, opening new shelves
+    and then new sheets as needed.
+    Returns ([(sheet, x, y) per input size], [(width, height) per sheet]).
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements = [None] * len(sizes)
+    sheets = []  # each: {"shelves": [[y, height, next_x]], "height": used_height}
+
+    for i in order:
+        width, height = sizes[i][0] + padding, sizes[i][1] + padding
+        placed = False
+
+        for sheet_index, sheet in enumerate(sheets):
+            for shelf in sheet["shelves"]:
+                shelf_y, shelf_height, next_x = shelf
+                if height <= shelf_height and next_x + width <= sheet_size:
+                    placements[i] = (sheet_index, next_x, shelf_y)
+                    shelf[2] += width
+                    placed = True
+                    break
+            if not placed and sheet["height"] + height <= sheet_size:
+                sheet["shelves"].append([sheet["height"], height, width])
+                placements[i] = (sheet_index, 0, sheet["height"])
+                sheet["height"] += height
+                placed = True
+            if placed:
+                break
+
+        if not placed:
+            sheets.append({"shelves": [[0, height, width]], "height": height})
+            placements[i] = (len(sheets) - 1, 0, 0)
+
+    sheet_sizes = [(max(shelf[2] for shelf in sheet["shelves"]), sheet["height"]) for sheet in sheets]
+    return placements, sheet_sizes
+
+def build_sprite_atlas(images_dir, output_dir="sprites", data_dir=".", cache_path=None, jobs=None):
+    """
+    Pack a thumbnail of every catalog image into sprite sheets with
+    Mapbox-format JSON indexes. Does nothing when no image has changed.
+    """
+    image_paths = {}
+    for catalog_file, language, dialect, entry in iter_catalog_entries(data_dir):
+        stem = image_stem(language, dialect)
+        image_path = find_catalog_image(images_dir, stem)
+        if image_path and stem not in image_paths:
+            image_paths[stem] = str(image_path)
+
+    cache = AssetCache(cache_path, version=SPRITE_CACHE_VERSION) if cache_path else None
+    thumbnails, resized = map_with_cache(make_thumbnail, sorted(set(image_paths.values())), cache, jobs,
+                                          root=images_dir)
+    print(f"Thumbnails for {len(image_paths)} images ({len(image_paths) - resized} cached, {resized} resized)")
+
+    sprites = sorted((stem, thumbnails[path]) for stem, path in image_paths.items() if thumbnails.get(path))
+
+    fingerprint_source = json.dumps([[stem, thumbnail["png"]] for stem, thumbnail in sprites]
+                                    + [PIXEL_RATIO, PADDING, SHEET_SIZE, SHEET_FORMAT, SHEET_QUALITY])
+    fingerprint = hashlib.sha1(fingerprint_source.encode('ascii')).hexdigest()[:12]
+
+    output_path = Path(data_dir) / output_dir
+    manifest_path = output_path / "manifest.json"
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous_manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous_manifest = {}
+    if previous_manifest.get("fingerprint") == fingerprint and all(
+            (output_path / sheet["image"]).exists() for sheet in previous_manifest["sheets"]):
+        print(f"Sprite atlas {fingerprint} is up to date")
+        return previous_manifest
+
+    placements, sheet_sizes = shelf_pack([(thumbnail["width"], thumbnail["height"]) for _, thumbnail in sprites])
+
+    sheet_images = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in sheet_sizes]
+    sheet_indexes = [{} for _ in sheet_sizes]
+    for (stem, thumbnail), (sheet, x, y) in zip(sprites, placements):
+        with Image.open(io.BytesIO(base64.b64decode(thumbnail["png"]))) as sprite:
+            sheet_images[sheet].paste(sprite, (x, y))
+        sheet_indexes[sheet][stem] = {
+            "x": x,
+            "y": y,
+            "width": thumbnail["width"],
+            "height": thumbnail["height"],
+            "pixelRatio": PIXEL_RATIO,
+        }
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    sheets = []
+    for sheet, (sheet_image, sheet_index) in enumerate(zip(sheet_images, sheet_indexes)):
+        # Content-addressed names so browsers never mix a new index with a cached sheet
+        name = f"languages-{fingerprint}-{sheet}"
+        sheet_image.save(output_path / f"{name}.{SHEET_FORMAT}", SHEET_FORMAT.upper(), quality=SHEET_QUALITY, method=6)
+        with open(output_path / f"{name}.json", 'w', encoding='utf-8') as f:
+            json.dump(sheet_index, f, separators=(',', ':'))
+        sheets.append({"image": f"{name}.{SHEET_FORMAT}", "index": f"{name}.json", "sprites": len(sheet_index)})
+        print(f"  ✓ {name}.{SHEET_FORMAT} {sheet_image.width}x{sheet_image.height} with {len(sheet_index)} sprites")
+
+    manifest = {"fingerprint": fingerprint, "pixelRatio": PIXEL_RATIO, "sheets": sheets}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    current_files = {sheet[key] for sheet in sheets for key in ("image", "index")}
+    for old_file in output_path.glob("languages-*"):
+        if old_file.name not in current_files:
+            old_file.unlink()
+
+    print(f"Built sprite atlas {fingerprint}: {len(sprites)} sprites on {len(sheets)} sheet(s)")
+    return manifest
+
+def main():
+    build_sprite_atlas("images_data", cache_path="../../.cache/sprite_thumbnails.json")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from catalog_versions import apply_change, diff_values
+
+CATALOG_STORE_JS = Path(__file__).resolve().parents[2] / "src" / "lib" / "catalogStore.js"
+
+# (old, new) pairs covering the edge cases of the keyed diff
+CASES = {
+    "removed key": (
+        {"es": {"mexican": {"speakers": 1}, "peninsular": {"speakers": 2}}},
+        {"es": {"mexican": {"speakers": 1}}},
+    ),
+    "added and changed keys": (
+        {"en": {"british": {"speakers": 1, "name": "English"}}},
+        {"en": {"british": {"speakers": 5, "name": "English"}, "welsh": {"speakers": 3}}},
+    ),
+    "string list edited": (
+        {"voice_ids": ["a", "b", "c"]},
+        {"voice_ids": ["a", "c", "d"]},
+    ),
+    "reordered list": (
+        {"voice_ids": ["a", "b", "c"]},
+        {"voice_ids": ["c", "a", "b"]},
+    ),
+    "list with duplicates": (
+        {"voice_ids": ["a", "a", "b"]},
+        {"voice_ids": ["a", "b", "b", "e"]},
+    ),
+    "duplicate added": (
+        {"voice_ids": ["a", "b"]},
+        {"voice_ids": ["a", "b", "a"]},
+    ),
+    "dict to list": (
+        {"fr": {"standard": {"placeholder": {"color": "#fff"}}}},
+        {"fr": {"standard": {"placeholder": ["#fff"]}}},
+    ),
+    "list to dict": (
+        {"fr": {"standard": ["x"]}},
+        {"fr": {"standard": {"x": 1}}},
+    ),
+    "value to null": (
+        {"de": {"standard": {"speakers": 10}}},
+        {"de": {"standard": {"speakers": None}}},
+    ),
+}
+
+@pytest.mark.parametrize("name", CASES)
+def test_python_round_trip(name):
+    old, new = CASES[name]
+    change = diff_values(old, new)
+    assert change is not None
+    assert apply_change(old, change) == new
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_js_applies_python_deltas():
+    """catalogStore.js must rebuild exactly what catalog_versions.py diffed"""
+    cases = [{"name": name, "old": old, "change": diff_values(old, new)} for name, (old, new) in CASES.items()]
+    script = f"""
+        import {{ applyCatalogChange }} from {json.dumps(CATALOG_STORE_JS.as_uri())};
+        const cases = JSON.parse(process.argv[1]);
+        const results = Object.fromEntries(cases.map(({{ name, old, change }}) => [name, applyCatalogChange(old, change)]));
+        console.log(JSON.stringify(results));
+    """
+    completed = subprocess.run(
+        ["node", "--no-warnings", "--input-type=module", "-e", script, json.dumps(cases)],
+        capture_output=True, text=True, check=True,
+    )
+    results = json.loads(completed.stdout)
+    for name, (old, new) in CASES.items():
+        assert results[name] == new, name
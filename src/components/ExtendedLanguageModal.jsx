@@ -14,6 +14,7 @@ export default function ExtendedLanguageModal({ languageGroup, currentIndex = 0,
   const [activeIndex, setActiveIndex] = useState(currentIndex);
   const [imageSrc, setImageSrc] = useState(null);
   const [imageTried, setImageTried] = useState(false);
+  const [imageLoaded, setImageLoaded] = useState(false);
   const [googleFontsData, setGoogleFontsData] = useState(null);
   const [fontsDataLoading, setFontsDataLoading] = useState(false);
   const closeBtnRef = useRef(null);
@@ -32,6 +33,15 @@ export default function ExtendedLanguageModal({ languageGroup, currentIndex = 0,
 
   const language = languages[activeIndex];
 
+  // Mapbox serializes nested feature properties, so a single-language dot carries the placeholder as JSON
+  const placeholder = useMemo(() => {
+    if (!language?.placeholder) return null;
+    if (typeof language.placeholder === 'string') {
+      try { return JSON.parse(language.placeholder); } catch { return null; }
+    }
+    return language.placeholder;
+  }, [language]);
+
   // Load image heuristically from public images folder
   useEffect(() => {
     if (!language) return;
@@ -42,6 +52,7 @@ export default function ExtendedLanguageModal({ languageGroup, currentIndex = 0,
     let cancelled = false;
     setImageSrc(null);
     setImageTried(false);
+    setImageLoaded(false);
     
     (async () => {
       for (const ext of IMAGE_EXTS) {
@@ -153,15 +164,34 @@ export default function ExtendedLanguageModal({ languageGroup, currentIndex = 0,
             <div className="grid md:grid-cols-2 gap-0">
               {/* Image / Placeholder */}
               <div className="relative h-64 md:h-full bg-gray-100 flex items-center justify-center p-4">
-                {imageSrc ? (
-                  <img src={imageSrc} alt={language.name} className="object-cover w-full h-full rounded-2xl shadow-2xl" />
-                ) : imageTried ? (
+                {imageTried && !imageSrc ? (
                   <div className="flex flex-col items-center text-gray-400 text-xs gap-2">
                     <ImageOff className="h-8 w-8" />
                     <span>No image available</span>
                   </div>
                 ) : (
-                  <div className="w-6 h-6 border-2 border-gray-300 border-t-gray-500 rounded-full animate-spin" />
+                  <div className="relative w-full h-full flex items-center justify-center">
+                    {!imageLoaded && (placeholder ? (
+                      // Precomputed colour + few-pixel thumbnail, painted until the photo has downloaded
+                      <div
+                        className="absolute inset-0 rounded-2xl shadow-2xl overflow-hidden"
+                        style={{ backgroundColor: placeholder.color }}
+                      >
+                        <img src={placeholder.thumbnail} alt="" aria-hidden="true" className="object-cover w-full h-full blur-lg scale-110" />
+                      </div>
+                    ) : (
+                      <div className="w-6 h-6 border-2 border-gray-300 border-t-gray-500 rounded-full animate-spin" />
+                    ))}
+                    {imageSrc && (
+                      <img
+                        src={imageSrc}
+                        alt={language.name}
+                        onLoad={() => setImageLoaded(true)}
+                        onError={() => setImageSrc(null)}
+                        className={`absolute inset-0 object-cover w-full h-full rounded-2xl shadow-2xl transition-opacity duration-300 ${imageLoaded ? 'opacity-100' : 'opacity-0'}`}
+                      />
+                    )}
+                  </div>
                 )}
               </div>
 
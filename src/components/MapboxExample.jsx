@@ -4,6 +4,8 @@ import React, { useEffect, useRef, useState } from "react";
 import mapboxgl from "mapbox-gl";
 import LanguageInfoCard from "./LanguageInfoCard";
 import MapLegend from "./MapLegend";
+import { loadCatalog } from "@/lib/catalogStore";
+import { loadSpriteAtlas } from "@/lib/spriteAtlas";
 
 import "mapbox-gl/dist/mapbox-gl.css";
 
@@ -20,17 +22,14 @@ const MapboxExample = () => {
     useEffect(() => {
         const loadLanguageData = async () => {
             try {
-                const [voiceResponse, endangeredResponse, severelyEndangeredResponse, descriptionsResponse] =
-                    await Promise.all([
-                        fetch("/data/data.json"),
-                        fetch("/data/definitely_endangered.json"),
-                        fetch("/data/severely_endangered.json"),
-                        fetch("/data/descriptions.json"),
-                    ]);
-
-                const voiceData = await voiceResponse.json();
-                const endangeredData = await endangeredResponse.json();
-                const severelyEndangeredData = await severelyEndangeredResponse.json();
+                const [catalog, descriptionsResponse] = await Promise.all([
+                    loadCatalog(),
+                    fetch("/data/descriptions.json"),
+                ]);
+
+                const voiceData = catalog["data.json"];
+                const endangeredData = catalog["definitely_endangered.json"];
+                const severelyEndangeredData = catalog["severely_endangered.json"];
                 const descriptions = await descriptionsResponse.json();
 
                 // Combine all datasets with their respective statuses
@@ -151,6 +150,9 @@ const MapboxExample = () => {
                         status = "severely_endangered"; // Red - Severely endangered
                     }
 
+                    // Same name as the image in images_data and its sprite in the atlas
+                    const spriteIcon = `${langCode}_${dialectKey.replace(/\s+/g, "_")}`.toLowerCase();
+
                     const fullName =
                         dialect.name || `${languageName} (${dialectKey.charAt(0).toUpperCase() + dialectKey.slice(1)})`;
 
@@ -165,6 +167,8 @@ const MapboxExample = () => {
                             speakers: speakers,
                             description: dialect.notes,
                             voice_ids: dialect.voice_ids,
+                            placeholder: dialect.placeholder,
+                            spriteIcon: spriteIcon,
                             notes: null,
                         };
 
@@ -189,6 +193,8 @@ const MapboxExample = () => {
                             speakers: speakers,
                             description: getLanguageDescription(fullName, dialectKey, languageName),
                             voice_ids: dialect.voice_ids,
+                            placeholder: dialect.placeholder,
+                            spriteIcon: spriteIcon,
                             notes: null,
                         };
                         // Group by coordinates
@@ -292,6 +298,7 @@ const MapboxExample = () => {
                               speakers: group.languages.reduce((sum, lang) => sum + lang.speakers, 0),
                               description: `${group.languages.length} languages available at this location`,
                               languages: group.languages, // Store all languages for the info card
+                              spriteIcon: group.languages[0].spriteIcon, // Photo of the most spoken language
                           }),
                     languageCount: group.languages.length,
                     isGroup: group.languages.length > 1,
@@ -439,6 +446,29 @@ const MapboxExample = () => {
                 },
             });
 
+            // Photo markers above the dots, drawn from the prebuilt sprite atlas
+            loadSpriteAtlas(map)
+                .then((spriteNames) => {
+                    if (spriteNames.size === 0 || !map.getSource("languages")) return;
+                    map.addLayer(
+                        {
+                            id: "language-photos",
+                            type: "symbol",
+                            source: "languages",
+                            minzoom: 2.5,
+                            filter: ["in", ["get", "spriteIcon"], ["literal", [...spriteNames]]],
+                            layout: {
+                                "icon-image": ["get", "spriteIcon"],
+                                "icon-anchor": "bottom",
+                                "icon-offset": [0, -8],
+                                "icon-allow-overlap": false,
+                            },
+                        },
+                        "language-count-labels"
+                    );
+                })
+                .catch((error) => console.error("Error loading sprite atlas:", error));
+
             // Add layer for language count labels (only show for groups with multiple languages)
             map.addLayer({
                 id: "language-count-labels",
@@ -0,0 +1,80 @@
+// Versioned catalog loading: keeps the last catalog in localStorage and, when the
+// pipeline has published a new version, fetches only the delta from the cached one.
+// Delta format is produced by public/data/catalog_versions.py.
+
+const VERSIONS_URL = "/data/catalog_versions";
+const STORAGE_KEY = "languagegarden:catalog";
+const CATALOG_FILES = ["data.json", "definitely_endangered.json", "severely_endangered.json"];
+
+export function applyCatalogChange(oldValue, change) {
+  if ("$set" in change) return change.$set;
+
+  if ("$add" in change || "$remove" in change) {
+    const removed = new Set(change.$remove || []);
+    return [...oldValue.filter((item) => !removed.has(item)), ...(change.$add || [])];
+  }
+
+  const updated = { ...oldValue };
+  for (const [key, nestedChange] of Object.entries(change)) {
+    if (nestedChange === null) delete updated[key];
+    else updated[key] = applyCatalogChange(updated[key], nestedChange);
+  }
+  return updated;
+}
+
+function readCachedCatalog() {
+  try {
+    return JSON.parse(localStorage.getItem(STORAGE_KEY));
+  } catch {
+    return null;
+  }
+}
+
+function writeCachedCatalog(version, catalog) {
+  try {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify({ version, catalog }));
+  } catch {
+    /* storage full or unavailable: next visit downloads the snapshot again */
+  }
+}
+
+async function fetchJson(url, options) {
+  const res = await fetch(url, options);
+  if (!res.ok) throw new Error(`Failed to fetch ${url}: ${res.status}`);
+  return res.json();
+}
+
+// Unversioned fallback for deployments where the pipeline hasn't published a manifest
+async function fetchCatalogFiles() {
+  const contents = await Promise.all(CATALOG_FILES.map((file) => fetchJson(`/data/${file}`)));
+  return Object.fromEntries(CATALOG_FILES.map((file, i) => [file, contents[i]]));
+}
+
+// Returns { "data.json": ..., "definitely_endangered.json": ..., "severely_endangered.json": ... }
+export async function loadCatalog() {
+  let manifest;
+  try {
+    manifest = await fetchJson(`${VERSIONS_URL}/manifest.json`, { cache: "no-cache" });
+  } catch {
+    return fetchCatalogFiles();
+  }
+
+  const cached = readCachedCatalog();
+  if (cached?.version === manifest.latest) return cached.catalog;
+
+  const delta = cached && manifest.deltas?.[cached.version];
+  if (delta) {
+    try {
+      const { changes } = await fetchJson(`${VERSIONS_URL}/${delta.path}`);
+      const catalog = applyCatalogChange(cached.catalog, changes);
+      writeCachedCatalog(manifest.latest, catalog);
+      return catalog;
+    } catch (error) {
+      console.warn("Catalog delta failed, downloading full snapshot:", error);
+    }
+  }
+
+  const catalog = await fetchJson(`${VERSIONS_URL}/${manifest.snapshot}`);
+  writeCachedCatalog(manifest.latest, catalog);
+  return catalog;
+}
@@ -0,0 +1,51 @@
+// Loads the language thumbnail sprite sheets built by public/data/sprite_atlas.py and
+// registers every sprite as a map image, so photo markers cost one request per sheet.
+
+const SPRITES_URL = "/data/sprites";
+
+async function fetchJson(url, options) {
+  const res = await fetch(url, options);
+  if (!res.ok) throw new Error(`Failed to fetch ${url}: ${res.status}`);
+  return res.json();
+}
+
+async function loadSheet(sheet) {
+  const [index, blob] = await Promise.all([
+    fetchJson(`${SPRITES_URL}/${sheet.index}`),
+    fetch(`${SPRITES_URL}/${sheet.image}`).then((res) => {
+      if (!res.ok) throw new Error(`Failed to fetch ${sheet.image}: ${res.status}`);
+      return res.blob();
+    }),
+  ]);
+
+  const bitmap = await createImageBitmap(blob);
+  const canvas = document.createElement("canvas");
+  canvas.width = bitmap.width;
+  canvas.height = bitmap.height;
+  const context = canvas.getContext("2d", { willReadFrequently: true });
+  context.drawImage(bitmap, 0, 0);
+  bitmap.close();
+
+  return { index, context };
+}
+
+// Returns the names of the sprites that were added (image stems such as "en_new_york")
+export async function loadSpriteAtlas(map) {
+  let manifest;
+  try {
+    manifest = await fetchJson(`${SPRITES_URL}/manifest.json`, { cache: "no-cache" });
+  } catch {
+    return new Set(); // atlas not built: the map keeps showing plain dots
+  }
+
+  const names = new Set();
+  const sheets = await Promise.all(manifest.sheets.map(loadSheet));
+  for (const { index, context } of sheets) {
+    for (const [name, { x, y, width, height, pixelRatio }] of Object.entries(index)) {
+      if (map.hasImage(name)) continue;
+      map.addImage(name, context.getImageData(x, y, width, height), { pixelRatio });
+      names.add(name);
+    }
+  }
+  return names;
+}